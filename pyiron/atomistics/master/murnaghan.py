@@ -300,14 +300,19 @@ class MurnaghanJobGenerator(JobGenerator):
         Returns:
             (list)
         """
-        parameter_lst = []
-        for strain in np.linspace(
+        strain_lst = np.linspace(
             1 - self._job.input["vol_range"],
             1 + self._job.input["vol_range"],
             self._job.input["num_points"],
-        ):
-            basis = self._job.ref_job.structure.copy()
-            basis.set_cell(basis.cell * strain ** (1.0 / 3.0), scale_atoms=True)
+        )
+        structure = self._job.ref_job.structure
+        cell_lst = np.array(structure.cell)[np.newaxis, :, :] * (
+            strain_lst ** (1.0 / 3.0)
+        )[:, np.newaxis, np.newaxis]
+        parameter_lst = []
+        for strain, cell in zip(strain_lst, cell_lst):
+            basis = structure.copy()
+            basis.set_cell(cell, scale_atoms=True)
             parameter_lst.append([np.round(strain, 7), basis])
         return parameter_lst
 
@@ -730,13 +735,15 @@ class Murnaghan(AtomisticParallelMaster):
             for job_id in self.child_ids:
                 ham = self.project_hdf5.inspect(job_id)
                 print("job_id: ", job_id, ham.status)
-                if "energy_tot" in ham["output/generic"].list_nodes():
-                    energy = ham["output/generic/energy_tot"][-1]
-                elif "energy_pot" in ham["output/generic"].list_nodes():
-                    energy = ham["output/generic/energy_pot"][-1]
+                hdf_generic = ham["output/generic"]
+                node_lst = hdf_generic.list_nodes()
+                if "energy_tot" in node_lst:
+                    energy = hdf_generic["energy_tot"][-1]
+                elif "energy_pot" in node_lst:
+                    energy = hdf_generic["energy_pot"][-1]
                 else:
                     raise ValueError('Neither energy_pot or energy_tot was found.')
-                volume = ham["output/generic/volume"][-1]
+                volume = hdf_generic["volume"][-1]
                 erg_lst.append(np.mean(energy))
                 err_lst.append(np.var(energy))
                 vol_lst.append(volume)